@@ -4,113 +4,716 @@
 # dependencies = [
 #   "typer",
 #   "rich",
+#   "numpy",
 # ]
 # ///
 
 import os
+import queue
+import shlex
+import shutil
 import subprocess
+import threading
 import json
+import struct
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich import print as rprint
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import av  # Optional: lets us analyse channels in-process instead of via ffmpeg
+except ImportError:
+    av = None
 
 # Initialize rich console
 console = Console()
 
-def has_identical_channels(file_path: Path) -> bool:
-    """Check if stereo audio file has identical channels"""
-    # First check number of channels
+# Resolve the ffmpeg binaries once instead of searching PATH on every spawn
+FFMPEG = shutil.which('ffmpeg')
+FFPROBE = shutil.which('ffprobe')
+
+# Bytes compared per pass over the ffmpeg PCM pipe; a multiple of the frame size
+PCM_CHUNK_SIZE = 1 << 20
+PCM_FRAME_SIZE = 8  # two interleaved 32-bit samples
+
+def _grow_pipe(pipe):
+    """Enlarge a pipe's kernel buffer where supported (Linux), so each read syscall moves more data"""
+    if hasattr(fcntl, 'F_SETPIPE_SZ'):
+        try:
+            fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PCM_CHUNK_SIZE)
+        except OSError:
+            pass  # Capped by /proc/sys/fs/pipe-max-size, the default size still works
+
+def _pcm_channels_identical(file_path: Path) -> Optional[bool]:
+    """Decode the first audio stream to raw stereo PCM and compare left and right samples
+
+    Returns None if the decode failed (or was killed) before giving an answer.
+    """
     cmd = [
-        'ffprobe',
-        '-i', str(file_path),
-        '-select_streams', 'a:0',
-        '-show_entries', 'stream=channels',
+        FFMPEG,
         '-v', 'quiet',
-        '-of', 'json'
+        '-threads', '1',  # Decoding PCM is serial work anyway
+        '-i', str(file_path),
+        '-map', '0:a:0',  # Select first audio stream
+        '-f', 's32le',  # 32-bit so 24-bit sources are compared losslessly
+        '-ac', '2',
+        '-'
     ]
     
+    # Unbuffered, so reads go straight into our buffer without an extra copy
+    process = subprocess.Popen(cmd, bufsize=0, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    _grow_pipe(process.stdout)
+    try:
+        buffer = bytearray(PCM_CHUNK_SIZE)
+        view = memoryview(buffer)
+        # Per-frame comparison results, reused so no mask is allocated per chunk
+        same = np.empty(PCM_CHUNK_SIZE // PCM_FRAME_SIZE, dtype=bool)
+        compared = 0
+        eof = False
+        while not eof:
+            # Fill the whole buffer before comparing so NumPy works on large blocks
+            filled = 0
+            while filled < len(buffer):
+                n = process.stdout.readinto(view[filled:])
+                if not n:
+                    eof = True
+                    break
+                filled += n
+            
+            # Only whole frames are compared, a trailing partial frame can only occur at EOF
+            count = filled // PCM_FRAME_SIZE
+            frames = np.frombuffer(buffer, dtype='<i4', count=count * 2).reshape(-1, 2)
+            if not np.equal(frames[:, 0], frames[:, 1], out=same[:count]).all():
+                return False
+            compared += count
+        
+        # A failed or empty decode gives us nothing to go on
+        if process.wait() != 0 or not compared:
+            return None
+        return True
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+def _av_channels_identical(file_path: Path) -> Tuple[int, Optional[bool]]:
+    """Open the file once with PyAV to get its channel count and, for stereo, compare the channels
+
+    The comparison result is None if no audio could be decoded.
+    """
+    with av.open(str(file_path)) as container:
+        stream = container.streams.audio[0]
+        channels = stream.codec_context.channels
+        if channels != 2:
+            return channels, False
+        
+        compared = False
+        for frame in container.decode(stream):
+            samples = frame.to_ndarray()
+            if frame.format.is_planar:
+                left, right = samples[0], samples[1]
+            else:
+                left, right = samples[0, 0::2], samples[0, 1::2]
+            if not np.array_equal(left, right):
+                return channels, False
+            compared = True
+        
+        return channels, True if compared else None
+
+CACHE_FILENAME = '.audio_converter_cache.json'
+
+def load_cache(target_dir: Path) -> dict:
+    """Load the probe/conversion cache from the target directory"""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=False)
-        audio_info = json.loads(result.stdout.decode('utf-8'))
-        channels = int(audio_info['streams'][0]['channels'])
+        with open(target_dir / CACHE_FILENAME, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(target_dir: Path, cache: dict):
+    """Atomically write the probe/conversion cache to the target directory"""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = target_dir / CACHE_FILENAME
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp_file, cache_file)
+
+def cache_entry(cache: dict, file_path: Path, stat: Optional[os.stat_result] = None) -> dict:
+    """Return the cache entry for a source file, resetting it if the file has changed"""
+    if stat is None:
+        stat = file_path.stat()
+    key = str(file_path)
+    entry = cache.get(key)
+    if not entry or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        cache[key] = entry
+    return entry
+
+def _aiff_channels(file_path: Path) -> Optional[int]:
+    """Read the channel count from the COMM chunk of an AIFF/AIFC file"""
+    with open(file_path, 'rb') as f:
+        form = f.read(12)
+        if len(form) < 12 or form[:4] != b'FORM' or form[8:] not in (b'AIFF', b'AIFC'):
+            return None
         
-        if channels != 2:  # If not stereo, return False
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id, size = struct.unpack('>4sI', chunk_header)
+            if chunk_id == b'COMM':
+                data = f.read(2)
+                return struct.unpack('>h', data)[0] if len(data) == 2 else None
+            # Chunks are padded to an even length
+            f.seek(size + (size & 1), os.SEEK_CUR)
+
+def _parse_header(file_path: Path) -> Optional[dict]:
+    """Read the format straight from a WAV/AIFF header, None if that isn't possible
+
+    WAV headers give channels, sample width and sample rate; for AIFF only
+    the channel count is read.
+    """
+    suffix = file_path.suffix.lower()
+    try:
+        if suffix == '.wav':
+            with wave.open(str(file_path)) as w:
+                return {'channels': w.getnchannels(), 'sample_width': w.getsampwidth(), 'sample_rate': w.getframerate()}
+        if suffix in ('.aiff', '.aif'):
+            channels = _aiff_channels(file_path)
+            return None if channels is None else {'channels': channels}
+    except Exception:
+        # A malformed header (wave can raise anything from wave.Error to
+        # RuntimeError on bad chunk sizes) just means ffprobe has to find out
+        pass
+    return None
+
+def read_header(file_path: Path, entry: Optional[dict] = None) -> Optional[dict]:
+    """Return the header format of a source file, parsed once and kept in its cache entry"""
+    if entry is not None and 'header' in entry:
+        return entry['header']
+    header = _parse_header(file_path)
+    if entry is not None:
+        entry['header'] = header
+    return header
+
+def has_identical_channels(file_path: Path, entry: Optional[dict] = None) -> bool:
+    """Check if stereo audio file has identical channels
+
+    If a cache entry is given, a previous result stored in it is reused and
+    a fresh result is recorded there. Failed probes count as not identical
+    but are not recorded, so they are retried on the next run.
+    """
+    if entry is not None and 'identical_channels' in entry:
+        return entry['identical_channels']
+    
+    # Stereo is the only layout worth comparing, so a header saying otherwise settles it
+    header = read_header(file_path, entry)
+    channels = header['channels'] if header else None
+    
+    if av is not None and channels in (None, 2):
+        try:
+            channels, identical = _av_channels_identical(file_path)
+        except (av.error.FFmpegError, IndexError):
             return False
+    else:
+        try:
+            # Fall back to ffprobe for headers we can't read ourselves
+            if channels is None:
+                cmd = [
+                    FFPROBE,
+                    '-i', str(file_path),
+                    '-select_streams', 'a:0',
+                    '-show_entries', 'stream=channels',
+                    '-v', 'quiet',
+                    '-of', 'default=noprint_wrappers=1:nokey=1'  # Just the bare number
+                ]
+                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=False)
+                if result.returncode != 0 or not result.stdout.strip():
+                    return False
+                channels = int(result.stdout.strip())
             
-        # For stereo files, compare channels using ffmpeg stats
-        check_cmd = [
-            'ffmpeg',
-            '-i', str(file_path),
-            '-map', '0:a:0',  # Select first audio stream
-            '-filter:a', 'astats=measure_perchannel=1:measure_overall=0',  # Get per-channel stats
-            '-f', 'null',
-            '-'
-        ]
-        
-        result = subprocess.run(check_cmd, capture_output=True, text=False)
-        # Use latin-1 encoding which can handle all byte values
-        stderr = result.stderr.decode('latin-1', errors='replace')
-        
-        # Look for DC offset and RMS values in both channels
-        # If they're very close, channels are likely identical
-        import re
-        dc_offsets = re.findall(r'DC offset: ([0-9.-]+)', stderr)
-        rms_levels = re.findall(r'RMS level: ([0-9.-]+)', stderr)
-        
-        if len(dc_offsets) >= 2 and len(rms_levels) >= 2:
-            dc_diff = abs(float(dc_offsets[0]) - float(dc_offsets[1]))
-            rms_diff = abs(float(rms_levels[0]) - float(rms_levels[1]))
-            return dc_diff < 0.0001 and rms_diff < 0.0001
+            # If not stereo there is nothing to compare, otherwise decode to raw
+            # PCM and compare the channels directly
+            identical = _pcm_channels_identical(file_path) if channels == 2 else False
             
+        except (subprocess.CalledProcessError, ValueError):
+            return False
+    
+    # A failed or interrupted probe is not an answer, so it is not cached
+    if identical is None:
         return False
-        
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError, IndexError):
+    
+    if entry is not None:
+        entry['channels'] = channels
+        entry['identical_channels'] = identical
+    return identical
+
+# Files converted by a single ffmpeg process in the threads backend
+BATCH_SIZE = 16
+
+class Backend(str, Enum):
+    """How the ffmpeg conversions are spawned"""
+    threads = "threads"
+    parallel = "parallel"
+
+def ffmpeg_threads(jobs: int) -> int:
+    """Threads per ffmpeg process, so parallel jobs share the CPU cores instead of oversubscribing them"""
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+def encoder_args(sample_rate: int, bit_depth: int, threads: int = 0) -> list:
+    """ffmpeg output options shared by every conversion, threads=0 lets ffmpeg decide"""
+    return [
+        '-acodec', 'pcm_s16le',  # Force 16-bit output
+        '-ar', str(sample_rate),  # Sample rate
+        '-sample_fmt', f's{bit_depth}',  # Bit depth
+        '-threads', str(threads)
+    ]
+
+def conversion_settings(target_file: Path, sample_rate: int, bit_depth: int) -> dict:
+    """Describe a conversion so cached results can be matched against it"""
+    return {'target': str(target_file), 'sample_rate': sample_rate, 'bit_depth': bit_depth}
+
+def _matches_target_format(file_path: Path, sample_rate: int, bit_depth: int, entry: Optional[dict] = None) -> bool:
+    """Check whether a file already is a 16-bit PCM WAV at the target sample rate"""
+    # The encoder is always pcm_s16le, so nothing else can come out unchanged
+    if bit_depth != 16 or file_path.suffix.lower() != '.wav':
         return False
+    header = read_header(file_path, entry)
+    return bool(header) and header['sample_width'] == 2 and header['sample_rate'] == sample_rate
 
-def convert_audio(source_file: Path, target_file: Path, sample_rate: int, bit_depth: int):
-    """Convert audio file using ffmpeg with specified parameters"""
-    target_file.parent.mkdir(parents=True, exist_ok=True)
+def convert_audio(source_file: Path, target_file: Path, sample_rate: int, bit_depth: int, entry: Optional[dict] = None, threads: int = 0) -> Tuple[bool, bool, Optional[str]]:
+    """Convert audio file using ffmpeg with specified parameters
+
+    Returns a (success, mono, error) tuple so the caller can report results;
+    this runs in worker threads and must not print itself. A successful
+    conversion is recorded in the cache entry, if given.
+    """
+    if entry is not None:
+        entry.pop('converted', None)
     
     # Check if we should convert to mono
-    should_mono = has_identical_channels(source_file)
+    should_mono = has_identical_channels(source_file, entry)
+    
+    # Files already in the target format are copied instead of re-encoded
+    if not should_mono and _matches_target_format(source_file, sample_rate, bit_depth, entry):
+        try:
+            shutil.copy2(source_file, target_file)
+        except OSError as e:
+            return False, False, str(e)
+        if entry is not None:
+            entry['converted'] = conversion_settings(target_file, sample_rate, bit_depth)
+        return True, False, None
     
     cmd = [
-        'ffmpeg', '-y',  # -y to overwrite output files
+        FFMPEG, '-y',  # -y to overwrite output files
+        '-v', 'error', '-nostats',  # Only errors end up on stderr
         '-i', str(source_file),
-        '-acodec', 'pcm_s16le',  # Force 16-bit output
-        '-ar', str(sample_rate),  # Sample rate
-        '-sample_fmt', f's{bit_depth}'  # Bit depth
-    ]
+    ] + encoder_args(sample_rate, bit_depth, threads)
     
     # Add mono conversion if needed
     if should_mono:
         cmd.extend(['-ac', '1'])
-        print(f"Converting to mono as channels are identical")
     
     cmd.append(str(target_file))
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=False)
-        if result.stderr:
-            print(f"ffmpeg output: {result.stderr.decode('latin-1', errors='ignore')}")
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     except subprocess.CalledProcessError as e:
-        print(f"Error converting {source_file}: {e.stderr}")
-        return False
-    return True
+        return False, should_mono, e.stderr.decode('latin-1', errors='ignore')
+    
+    if entry is not None:
+        entry['converted'] = conversion_settings(target_file, sample_rate, bit_depth)
+    return True, should_mono, None
 
-def process_directory(source_dir: Path, target_dir: Path, sample_rate: int, bit_depth: int):
+def convert_batch(source_files: list, targets: dict, mono: dict, entries: dict, sample_rate: int, bit_depth: int, threads: int = 0, stop: Optional[threading.Event] = None) -> list:
+    """Convert several files with a single ffmpeg process, one output per input
+
+    Returns a (success, mono, error) tuple per file. If ffmpeg fails the batch
+    is redone file by file so one broken input doesn't fail the others,
+    unless stop is set (e.g. on Ctrl-C, which also kills ffmpeg).
+    Files already in the target format are copied by convert_audio instead.
+    """
+    # Don't start any new ffmpeg once we've been told to stop
+    if stop is not None and stop.is_set():
+        return [(False, mono[f], "Interrupted") for f in source_files]
+    
+    results = {}
+    encode = []
+    for f in source_files:
+        if len(source_files) == 1 or not mono[f] and _matches_target_format(f, sample_rate, bit_depth, entries[f]):
+            results[f] = convert_audio(f, targets[f], sample_rate, bit_depth, entries[f], threads)
+        else:
+            encode.append(f)
+    
+    if encode:
+        cmd = [FFMPEG, '-y']  # -y to overwrite output files
+        for f in encode:
+            cmd.extend(['-i', str(f)])
+        
+        # Output options apply per output file, so mono conversion can be chosen per file
+        for index, f in enumerate(encode):
+            # Without explicit mapping every output would get the tags and chapters of input 0
+            cmd.extend(['-map', f'{index}:a:0', '-map_metadata', str(index), '-map_chapters', str(index)])
+            cmd.extend(encoder_args(sample_rate, bit_depth, threads))
+            if mono[f]:
+                cmd.extend(['-ac', '1'])
+            cmd.append(str(targets[f]))
+        
+        for f in encode:
+            entries[f].pop('converted', None)
+        
+        if stop is not None and stop.is_set():
+            return [results.get(f, (False, mono[f], "Interrupted")) for f in source_files]
+        
+        # Only the exit status matters here; failures are diagnosed by the per-file retry
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for f in encode:
+            if result.returncode != 0 and stop is not None and stop.is_set():
+                results[f] = (False, mono[f], "Interrupted")
+            elif result.returncode != 0:
+                results[f] = convert_audio(f, targets[f], sample_rate, bit_depth, entries[f], threads)
+            else:
+                entries[f]['converted'] = conversion_settings(targets[f], sample_rate, bit_depth)
+                results[f] = (True, mono[f], None)
+    
+    return [results[f] for f in source_files]
+
+AUDIO_EXTENSIONS = ('.wav', '.aiff', '.aif')
+
+def _walk(root: str, exclude: Optional[str] = None):
+    """Recursively yield directory entries of audio files below root, skipping the exclude directory
+
+    Symlinked directories aren't followed, so below a resolved root every
+    entry path is a real path and can be compared to exclude as a string.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        # Unreadable directories are skipped, as Path.rglob does
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path != exclude:
+                    yield from _walk(entry.path, exclude)
+            elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                yield entry
+
+def discover(source_dir: Path, target_dir: Path, cache: dict, sample_rate: int, bit_depth: int, resume: bool, counts: dict):
+    """Lazily yield (source, target, cache entry) for every audio file to convert
+
+    Target directories are created as they are first seen. The number of files
+    found and skipped is tallied in counts as the walk goes.
+    """
+    created = set()
+    # Conversion runs while we walk, so a target inside the source tree must be
+    # skipped or its fresh outputs would be picked up and converted again
+    source_dir = source_dir.resolve()
+    for dir_entry in _walk(str(source_dir), os.path.realpath(target_dir)):
+        # Keep the stat result from the walk for the cache
+        source_file = Path(dir_entry.path)
+        target_file = target_dir / source_file.relative_to(source_dir)
+        try:
+            entry = cache_entry(cache, source_file, dir_entry.stat())
+        except OSError:
+            # e.g. a dangling symlink: leave it out of the cache and let the
+            # conversion report it as failed, rather than aborting the walk
+            entry = {}
+        counts['found'] += 1
+        
+        # Skip files that were already converted with the same settings and are unchanged since
+        if resume and entry.get('converted') == conversion_settings(target_file, sample_rate, bit_depth) and target_file.exists():
+            counts['skipped'] += 1
+            continue
+        
+        if target_file.parent not in created:
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            created.add(target_file.parent)
+        
+        yield source_file, target_file, entry
+
+def process_directory(source_dir: Path, target_dir: Path, sample_rate: int, bit_depth: int, jobs: int, resume: bool = False, backend: Backend = Backend.threads):
     """Recursively process all wav and aiff files in source directory"""
-    audio_extensions = {'.wav', '.aiff', '.aif'}
+    # Probe and conversion results from earlier runs, keyed by source path
+    cache = load_cache(target_dir)
+    counts = {'found': 0, 'skipped': 0}
     
-    # Get list of files first
-    audio_files = [f for f in source_dir.rglob('*') if f.suffix.lower() in audio_extensions]
+    try:
+        convert_all(discover(source_dir, target_dir, cache, sample_rate, bit_depth, resume, counts), sample_rate, bit_depth, jobs, backend)
+    finally:
+        # Without any files found the cache can't have changed, and the target
+        # directory shouldn't be created just to hold it
+        if counts['found']:
+            save_cache(target_dir, cache)
     
-    if not audio_files:
+    if not counts['found']:
         console.print("[yellow]No audio files found in the source directory.[/yellow]")
+    elif counts['skipped']:
+        console.print(f"[white]Skipped[/white] [green]{counts['skipped']}[/green] [white]already converted file(s)[/white]")
+
+def report_result(progress: Progress, task, source_file: Path, success: bool, mono: bool, error: Optional[str]):
+    """Print the outcome of a single conversion and advance the progress bar"""
+    if success:
+        suffix = " (mono)" if mono else ""
+        console.print(f"[green]✓[/green] Converted: {source_file.name}{suffix}")
+    else:
+        console.print(f"[red]✗[/red] Failed to convert: {source_file.name}")
+        if error:
+            console.print(error, markup=False, highlight=False)
+    
+    progress.update(task, description=f"[cyan]Converted: {source_file.name}")
+    progress.advance(task)
+
+def failed_result(e: Exception) -> tuple:
+    """(success, mono, error) tuple reporting an unexpected error for a file"""
+    return False, False, f"{type(e).__name__}: {e}"
+
+def analyse_channels(progress: Progress, task, audio_files: list, entries: dict, jobs: int) -> dict:
+    """Check all files for identical channels up-front, returns {file: mono}
+
+    Files whose check raises are reported as failed and left out of the result.
+    """
+    def probe(f: Path):
+        try:
+            return has_identical_channels(f, entries[f]), None
+        except Exception as e:
+            return None, failed_result(e)
+    
+    progress.update(task, description="[cyan]Analysing channels...")
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        mono = {}
+        for f, (identical, failure) in zip(audio_files, executor.map(probe, audio_files)):
+            if failure:
+                report_result(progress, task, f, *failure)
+            else:
+                mono[f] = identical
+    finally:
+        # On Ctrl-C, don't start the probes that are still queued
+        executor.shutdown(cancel_futures=True)
+    progress.update(task, description="[cyan]Converting audio files...")
+    return mono
+
+def convert_with_threads(progress: Progress, task, files, sample_rate: int, bit_depth: int, jobs: int):
+    """Convert files in batches of up to BATCH_SIZE per ffmpeg process, spawned from a thread pool
+
+    Files are converted while the source tree is still being walked: a walker
+    thread feeds a bounded queue that the conversion workers pull from. Each
+    file's channel analysis is started on a separate pool as soon as the file
+    is found, so it runs concurrently and ahead of its conversion.
+    """
+    threads = ffmpeg_threads(jobs)
+    pending = queue.Queue(maxsize=jobs * BATCH_SIZE)
+    results = queue.Queue()
+    # Set once the workers are gone, so the walker doesn't block on a full queue
+    # forever, or on Ctrl-C, so the walker and workers stop picking up new files
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def get():
+        while not stop.is_set():
+            try:
+                return pending.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+    
+    def walk(probe_executor: ThreadPoolExecutor):
+        total = 0
+        try:
+            for source_file, target_file, entry in files:
+                probe = probe_executor.submit(has_identical_channels, source_file, entry)
+                if not put((source_file, target_file, entry, probe)):
+                    probe.cancel()
+                    break
+                total += 1
+                progress.update(task, total=total)
+        finally:
+            # One stop marker per worker
+            for _ in range(jobs):
+                put(None)
+    
+    def convert(batch: list):
+        targets = {source_file: target_file for source_file, target_file, _, _ in batch}
+        entries = {source_file: entry for source_file, _, entry, _ in batch}
+        probes = {source_file: probe for source_file, _, _, probe in batch}
+        
+        # Errors are reported as failed conversions rather than losing the worker;
+        # a file that can't be analysed doesn't take the rest of its batch down
+        batch_results = {}
+        mono = {}
+        for f in targets:
+            try:
+                mono[f] = probes[f].result()
+            except Exception as e:
+                batch_results[f] = failed_result(e)
+        
+        source_files = [f for f in targets if f not in batch_results]
+        # Ctrl-C kills the probes, so don't go on to convert with their results
+        if stop.is_set():
+            batch_results.update((f, (False, False, "Interrupted")) for f in source_files)
+            source_files = []
+        try:
+            batch_results.update(zip(source_files, convert_batch(source_files, targets, mono, entries, sample_rate, bit_depth, threads, stop)))
+        except Exception as e:
+            batch_results.update((f, failed_result(e)) for f in source_files)
+        
+        for source_file in targets:
+            results.put((source_file, batch_results[source_file]))
+    
+    def work():
+        try:
+            done = False
+            while not done:
+                item = get()
+                if item is None:
+                    break
+                
+                # Batch up whatever else is queued, but only a fair share of it so
+                # the other workers aren't left idle
+                batch = [item]
+                limit = max(1, min(BATCH_SIZE, pending.qsize() // jobs))
+                while len(batch) < limit:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        done = True
+                        break
+                    batch.append(item)
+                
+                convert(batch)
+        finally:
+            results.put(None)
+    
+    # Each probe and conversion blocks on a subprocess, so threads are enough
+    with ThreadPoolExecutor(max_workers=jobs) as probe_executor, ThreadPoolExecutor(max_workers=jobs + 1) as executor:
+        walker = executor.submit(walk, probe_executor)
+        workers = [executor.submit(work) for _ in range(jobs)]
+        
+        try:
+            finished = 0
+            while finished < jobs:
+                item = results.get()
+                if item is None:
+                    finished += 1
+                    continue
+                source_file, result = item
+                report_result(progress, task, source_file, *result)
+        finally:
+            # Also reached on Ctrl-C: the executors then only wait for the running
+            # probes and batches
+            stop.set()
+            probe_executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Surface any errors from the walk or the workers
+        for future in [walker] + workers:
+            future.result()
+
+def convert_with_parallel(progress: Progress, task, audio_files: list, targets: dict, entries: dict, sample_rate: int, bit_depth: int, jobs: int):
+    """Convert files by handing the ffmpeg invocations to GNU parallel
+
+    Channel analysis still happens here since it decides the channel layout of
+    each output; the conversions themselves are spawned by parallel.
+    """
+    mono = analyse_channels(progress, task, audio_files, entries, jobs)
+    audio_files = [f for f in audio_files if f in mono]
+    threads = ffmpeg_threads(jobs)
+    
+    # Files already in the target format are just copied, everything else goes to parallel
+    encode = []
+    for f in audio_files:
+        if not mono[f] and _matches_target_format(f, sample_rate, bit_depth, entries[f]):
+            report_result(progress, task, f, *convert_audio(f, targets[f], sample_rate, bit_depth, entries[f], threads))
+        else:
+            encode.append(f)
+    if not encode:
         return
+    
+    # Every job gets source, target and channel filter as {1}, {2} and {3} and
+    # reports its sequence number and exit status on stdout when done
+    command = ' '.join(
+        [shlex.quote(FFMPEG), '-nostdin', '-v', 'error', '-y', '-i', '{1}']
+        + [shlex.quote(arg) for arg in encoder_args(sample_rate, bit_depth, threads)]
+        + ['-af', '{3}', '{2}', '2>/dev/null;', 'echo', '{#}', '$?']
+    )
+    cmd = ['parallel', '--will-cite', '-0', '-N', '3', '--jobs', str(jobs), command]
+    env = dict(os.environ, PARALLEL_SHELL='/bin/sh')
+    
+    def write_jobs(stdin):
+        with stdin:
+            for f in encode:
+                entries[f].pop('converted', None)
+                channel_filter = 'aformat=channel_layouts=mono' if mono[f] else 'anull'
+                stdin.write(b'\0'.join([os.fsencode(f), os.fsencode(targets[f]), channel_filter.encode()]) + b'\0')
+    
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+    # Feed the job list from a separate thread so a full stdout pipe can't deadlock us
+    writer = threading.Thread(target=write_jobs, args=(process.stdin,), daemon=True)
+    writer.start()
+    
+    pending = set(encode)
+    with process.stdout:
+        for line in process.stdout:
+            try:
+                seq, status = line.split()
+                source_file = encode[int(seq) - 1]
+            except (ValueError, IndexError):
+                continue
+            
+            pending.discard(source_file)
+            if status == b'0':
+                entries[source_file]['converted'] = conversion_settings(targets[source_file], sample_rate, bit_depth)
+                report_result(progress, task, source_file, True, mono[source_file], None)
+            else:
+                # Job output is discarded, so redo the file here to get ffmpeg's error message
+                report_result(progress, task, source_file, *convert_audio(source_file, targets[source_file], sample_rate, bit_depth, entries[source_file], threads))
+    
+    writer.join()
+    process.wait()
+    
+    # Anything parallel never reported on was not converted, try it directly
+    if pending:
+        console.print(f"[yellow]GNU parallel exited with status {process.returncode} before converting {len(pending)} file(s), converting them one by one.[/yellow]")
+    for source_file in encode:
+        if source_file in pending:
+            report_result(progress, task, source_file, *convert_audio(source_file, targets[source_file], sample_rate, bit_depth, entries[source_file], threads))
+
+def gnu_parallel_available() -> bool:
+    """Check that `parallel` on PATH is GNU parallel and not e.g. the moreutils one"""
+    if shutil.which('parallel') is None:
+        return False
+    try:
+        result = subprocess.run(['parallel', '--version'], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return b'GNU parallel' in result.stdout
 
+def convert_all(files, sample_rate: int, bit_depth: int, jobs: int, backend: Backend = Backend.threads):
+    """Convert the given (source, target, cache entry) tuples in parallel while showing progress"""
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -118,30 +721,28 @@ def process_directory(source_dir: Path, target_dir: Path, sample_rate: int, bit_
         TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("[cyan]Converting audio files...", total=len(audio_files))
+        # The total grows as files are discovered
+        task = progress.add_task("[cyan]Converting audio files...", total=None)
         
-        for source_file in audio_files:
-            progress.update(task, description=f"[cyan]Converting: {source_file.name}")
-            
-            # Create corresponding target path
-            relative_path = source_file.relative_to(source_dir)
-            target_file = target_dir / relative_path
-            
-            # Ensure target directory exists
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if convert_audio(source_file, target_file, sample_rate, bit_depth):
-                console.print(f"[green]✓[/green] Converted: {source_file.name}")
-            else:
-                console.print(f"[red]✗[/red] Failed to convert: {source_file.name}")
-            
-            progress.advance(task)
+        if backend == Backend.parallel:
+            # Channels are analysed up-front for parallel, so it needs the full list
+            files = list(files)
+            progress.update(task, total=len(files))
+            audio_files = [source_file for source_file, _, _ in files]
+            targets = {source_file: target_file for source_file, target_file, _ in files}
+            entries = {source_file: entry for source_file, _, entry in files}
+            convert_with_parallel(progress, task, audio_files, targets, entries, sample_rate, bit_depth, jobs)
+        else:
+            convert_with_threads(progress, task, files, sample_rate, bit_depth, jobs)
 
 def main(
     source_dir: Path = typer.Argument(..., help="Source directory containing audio files", exists=True, dir_okay=True, file_okay=False),
     target_dir: Path = typer.Argument(..., help="Target directory for converted files"),
     sample_rate: int = typer.Option(44100, "--sample-rate", "-sr", help="Sample rate in Hz"),
     bit_depth: int = typer.Option(16, "--bit-depth", "-bd", help="Bit depth"),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", min=1, help="Number of files to convert in parallel"),
+    resume: bool = typer.Option(False, "--resume", help="Skip files already converted with the same settings"),
+    backend: Backend = typer.Option(Backend.threads, "--backend", help="Spawn ffmpeg from a thread pool or via GNU parallel"),
 ):
     """
     Convert audio files to specified format while maintaining directory structure.
@@ -150,13 +751,22 @@ def main(
     source_path = source_dir.resolve()
     target_path = target_dir.resolve()
     
+    if FFMPEG is None or FFPROBE is None:
+        console.print("[red]ffmpeg and ffprobe are required but were not found on PATH.[/red]")
+        raise typer.Exit(1)
+    
+    if backend == Backend.parallel and not gnu_parallel_available():
+        console.print("[yellow]GNU parallel not found, falling back to the threads backend.[/yellow]")
+        backend = Backend.threads
+    
     console.print("\n[bold cyan]Audio Converter[/bold cyan]")
     console.print(f"[white]Source directory:[/white] [yellow]{source_path}[/yellow]")
     console.print(f"[white]Target directory:[/white] [yellow]{target_path}[/yellow]")
     console.print(f"[white]Sample rate:[/white] [green]{sample_rate}[/green] Hz")
-    console.print(f"[white]Bit depth:[/white] [green]{bit_depth}[/green] bit\n")
+    console.print(f"[white]Bit depth:[/white] [green]{bit_depth}[/green] bit")
+    console.print(f"[white]Parallel jobs:[/white] [green]{jobs}[/green] ({backend.value})\n")
     
-    process_directory(source_path, target_path, sample_rate, bit_depth)
+    process_directory(source_path, target_path, sample_rate, bit_depth, jobs, resume, backend)
     
     console.print("\n[bold green]Conversion complete![/bold green]")
 